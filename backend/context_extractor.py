@@ -8,45 +8,44 @@ from typing import Optional
 from llm_client import call_llm
 
 
+_CODE_BLOCK_RE = re.compile(r"```(?:\w+)?\n?(.*?)```", re.DOTALL)
+# Objects are tried before arrays, so a footnote like "[1]" or an index like
+# "arr[0]" in prose never wins over the real payload. An object must open with
+# a key or close immediately; skips prose braces.
+_JSON_START_RES = (re.compile(r'\{(?=\s*["}])'), re.compile(r"\["))
+_JSON_DECODER = json.JSONDecoder()
+
+
 def extract_code_blocks(text: str) -> str:
     """Extract content from ```...``` blocks."""
-    blocks = re.findall(r"```(?:\w+)?\n?(.*?)```", text, re.DOTALL)
-    return "\n\n".join(b.strip() for b in blocks) if blocks else ""
+    return "\n\n".join(m.group(1).strip() for m in _CODE_BLOCK_RE.finditer(text))
 
 
 def extract_json(text: str) -> str:
-    """Extract first valid JSON object/array from text."""
-    for start_char, end_char in [("{", "}"), ("[", "]")]:
-        start = text.find(start_char)
-        if start == -1:
-            continue
-        depth = 0
-        i = start
-        while i < len(text):
-            c = text[i]
-            if c == start_char:
-                depth += 1
-            elif c == end_char:
-                depth -= 1
-                if depth == 0:
-                    candidate = text[start : i + 1]
-                    try:
-                        json.loads(candidate)
-                        return candidate
-                    except json.JSONDecodeError:
-                        pass
-            i += 1
+    """Extract first valid JSON object from text, else the first valid array."""
+    for start_re in _JSON_START_RES:
+        for m in start_re.finditer(text):
+            start = m.start()
+            try:
+                _, end = _JSON_DECODER.raw_decode(text, start)
+                return text[start:end]
+            except (json.JSONDecodeError, RecursionError):
+                continue
     return ""
 
 
 async def extract_summary(text: str, model: str = "kimi-k2p5") -> str:
     """Use LLM to produce a concise summary for next step context."""
-    if len(text) < 500:
+    # ~4 chars per token; short outputs are cheaper to pass through as-is.
+    approx_tokens = len(text) >> 2
+    if approx_tokens < 400:
         return text
     messages = [
         {"role": "user", "content": f"Summarize the following in 2-4 sentences, preserving key facts and outputs:\n\n{text}"}
     ]
-    summary, _, _, _, _ = await call_llm(messages, model=model, max_tokens=256)
+    summary, _, _, _, _ = await call_llm(
+        messages, model=model, max_tokens=min(256, approx_tokens // 3), temperature=0.0
+    )
     return summary.strip()
 
 
@@ -1,13 +1,21 @@
 """Database connection and session management."""
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from config import settings
 
+# No pre-ping: recycling well inside MySQL's wait_timeout keeps pooled
+# connections fresh without a SELECT 1 on every checkout.
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_pre_ping=False,
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=40,
+    pool_reset_on_return="rollback",
     echo=False,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
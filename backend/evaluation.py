@@ -5,12 +5,25 @@ Evaluation order: Rule checks -> LLM judge (if enabled) -> final decision.
 
 import re
 import json
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 from llm_client import call_llm
 
 
 # ---------------- Rule handlers ---------------- #
 
+_META = frozenset(r".^$*+?{}[]\|()")
+
+
+def _is_literal(pattern: str) -> bool:
+    return not any(c in _META for c in pattern)
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern, re.DOTALL)
+
+
 def _rule_contains(text: str, value: str) -> bool:
     return bool(value and text and value in text)
 
@@ -18,17 +31,31 @@ def _rule_contains(text: str, value: str) -> bool:
 def _rule_regex(text: str, pattern: str) -> bool:
     if not text or not pattern:
         return False
+
+    # Fast paths: shapes that need no regex engine at all.
+    if pattern in (".*", ".+"):
+        return True
+    if _is_literal(pattern):
+        return pattern in text
+    if pattern[0] == "^" and _is_literal(pattern[1:]):
+        return text.startswith(pattern[1:])
+
     try:
-        return bool(re.search(pattern, text, re.DOTALL))
+        return bool(_compile(pattern).search(text))
     except re.error:
         return False
 
 
+# Characters a JSON document can start with (json.loads also takes NaN/Infinity).
+_JSON_FIRST_CHARS = frozenset('{["tfnNI-0123456789')
+
+
 def _rule_json_valid(text: str, _: Optional[str]) -> bool:
-    if not text:
+    s = text.lstrip() if text else ""
+    if not s or s[0] not in _JSON_FIRST_CHARS:
         return False
     try:
-        json.loads(text)
+        json.loads(s)
         return True
     except (json.JSONDecodeError, TypeError):
         return False
@@ -74,7 +101,7 @@ async def evaluate_llm_judge(
 
     messages = [{"role": "user", "content": full_prompt}]
 
-    content, *_ = await call_llm(messages, model=model, max_tokens=512)
+    content, *_ = await call_llm(messages, model=model, max_tokens=512, temperature=0.0)
 
     try:
         data = json.loads(content)
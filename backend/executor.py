@@ -1,13 +1,15 @@
 """
 Workflow execution engine - core logic.
-Sequential step execution, retry with feedback injection, completion evaluation, context passing.
+Position-ordered step execution, retry with feedback injection, completion evaluation, context passing.
 """
 
-import uuid
+import json
+import asyncio
 from datetime import datetime
-from sqlalchemy.orm import Session
+from itertools import groupby
+from sqlalchemy.orm import Session, joinedload
 
-from models import Workflow, WorkflowStep, WorkflowRun, StepRun, LLMLog
+from models import Workflow, WorkflowStep, WorkflowRun, StepRun, LLMLog, new_id
 from llm_client import call_llm
 from evaluation import evaluate_completion
 from context_extractor import extract_context_async
@@ -28,11 +30,10 @@ def _build_messages(prompt_template: str, context: str | None, retry_feedback: s
     Inject context directly into prompt (Option A).
     """
 
+    # No post-check for a leftover "{{context}}": replace() does not rescan the
+    # text it inserts, so one found afterwards could only come from `context`.
     prompt = prompt_template.replace("{{context}}", context or "")
 
-    if "{{context}}" in prompt:
-        raise RuntimeError("Context placeholder '{{context}}' was not replaced")
-
     system_content = ""
     if retry_feedback:
         system_content = RETRY_FEEDBACK_TEMPLATE.format(feedback=retry_feedback)
@@ -71,11 +72,11 @@ async def _execute_single_step(
     )
 
     llm_log = LLMLog(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         step_run_id=step_run.id,
         call_type="retry" if retry_feedback else "main",
         attempt_number=step_run.attempt_number,
-        prompt=str(messages),
+        prompt=json.dumps(messages, ensure_ascii=False, separators=(",", ":")),
         response=content,
         input_tokens=in_tok,
         output_tokens=out_tok,
@@ -84,10 +85,10 @@ async def _execute_single_step(
         model=step.model,
         latency_ms=latency,
     )
+    # Committed by the caller together with this attempt's step_run update.
     db.add(llm_log)
-    db.commit()
 
-    passed, eval_result = await evaluate_completion(
+    evaluation = evaluate_completion(
         output=content,
         rule_type=step.rule_type,
         rule_value=step.rule_value,
@@ -95,13 +96,33 @@ async def _execute_single_step(
         llm_judge_prompt=step.llm_judge_prompt,
         model=step.model,
     )
-
-    extracted = await extract_context_async(
+    extraction = extract_context_async(
         content,
         step.context_mode,
         step.model,
     )
-    
+
+    # Judge and summary both only read `content`; overlap them when either
+    # needs a network call.
+    if step.llm_judge_enabled or step.context_mode == "summary":
+        tasks = [asyncio.ensure_future(evaluation), asyncio.ensure_future(extraction)]
+        try:
+            (passed, eval_result), extracted = await asyncio.gather(*tasks)
+        except BaseException:
+            # gather() leaves the sibling running; cancel it so it doesn't hold
+            # a limiter slot into the next attempt.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    else:
+        try:
+            passed, eval_result = await evaluation
+        except BaseException:
+            extraction.close()
+            raise
+        extracted = await extraction
+
     if step.context_mode != "full" and not extracted.strip():
         extracted = content.strip()
 
@@ -114,9 +135,81 @@ async def _execute_single_step(
     return content, extracted, passed, eval_result
 
 
+async def _run_step(
+    db: Session,
+    run: WorkflowRun,
+    step: WorkflowStep,
+    input_context: str | None,
+) -> tuple[bool, str | None, str]:
+    """
+    Run one step with its retry budget.
+    Returns (passed, extracted_context, failure_reason).
+    """
+
+    step_run = StepRun(
+        id=new_id(),
+        workflow_run_id=run.id,
+        workflow_step_id=step.id,
+        position=step.position,
+        status="running",
+        input_context=input_context,
+        started_at=datetime.utcnow(),
+    )
+    db.add(step_run)
+    db.commit()
+
+    retry_count = 0
+    failure_reason = ""
+
+    while retry_count <= step.retry_limit:
+        step_run.attempt_number = retry_count + 1
+
+        retry_feedback = (
+            f"Attempt {retry_count} failed. Reason: {failure_reason}"
+            if retry_count > 0
+            else None
+        )
+
+        try:
+            output, extracted, passed, eval_result = await _execute_single_step(
+                db=db,
+                step=step,
+                step_run=step_run,
+                input_context=input_context,
+                retry_feedback=retry_feedback,
+            )
+        except Exception as e:
+            passed = False
+            eval_result = {"error": str(e)}
+            failure_reason = str(e)
+
+        if passed:
+            step_run.status = "completed"
+            step_run.output = output
+            step_run.extracted_context = extracted
+            step_run.evaluation_result = eval_result
+            step_run.completed_at = datetime.utcnow()
+            db.commit()
+            return True, extracted, ""
+
+        step_run.evaluation_result = eval_result
+        failure_reason = eval_result.get("reason") or str(eval_result)
+        retry_count += 1
+        if retry_count <= step.retry_limit:
+            db.commit()
+
+    step_run.status = "failed"
+    step_run.failure_reason = failure_reason
+    step_run.completed_at = datetime.utcnow()
+    db.commit()
+    return False, None, failure_reason
+
+
 async def run_workflow(db: Session, workflow_run_id: str) -> None:
     """
     Main execution loop. Runs workflow asynchronously, updates DB.
+    Steps sharing a position run concurrently; their contexts are joined
+    and handed to the next position.
     """
 
     run = db.query(WorkflowRun).filter(WorkflowRun.id == workflow_run_id).first()
@@ -127,80 +220,40 @@ async def run_workflow(db: Session, workflow_run_id: str) -> None:
     run.started_at = datetime.utcnow()
     db.commit()
 
-    workflow = db.query(Workflow).filter(Workflow.id == run.workflow_id).first()
+    workflow = (
+        db.query(Workflow)
+        .options(joinedload(Workflow.steps))
+        .filter(Workflow.id == run.workflow_id)
+        .first()
+    )
     steps = sorted(workflow.steps, key=lambda s: s.position)
 
     accumulated_context: str | None = None
 
     try:
-        for step in steps:
-            step_run = StepRun(
-                id=str(uuid.uuid4()),
-                workflow_run_id=run.id,
-                workflow_step_id=step.id,
-                position=step.position,
-                status="running",
-                input_context=accumulated_context,
-                started_at=datetime.utcnow(),
+        for _, group in groupby(steps, key=lambda s: s.position):
+            group = list(group)
+            results = await asyncio.gather(
+                *[_run_step(db, run, step, accumulated_context) for step in group],
+                return_exceptions=True,
             )
-            db.add(step_run)
-            db.commit()
 
-            retry_count = 0
-            passed = False
-            failure_reason = ""
-
-            while retry_count <= step.retry_limit:
-                step_run.attempt_number = retry_count + 1
-
-                retry_feedback = (
-                    f"Attempt {retry_count} failed. Reason: {failure_reason}"
-                    if retry_count > 0
-                    else None
-                )
-
-                try:
-                    output, extracted, passed, eval_result = await _execute_single_step(
-                        db=db,
-                        step=step,
-                        step_run=step_run,
-                        input_context=accumulated_context,
-                        retry_feedback=retry_feedback,
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+            for step, (passed, _, failure_reason) in zip(group, results):
+                if not passed:
+                    run.status = "failed"
+                    run.failure_reason = (
+                        f"Step '{step.name}' failed after {step.retry_limit} retries: "
+                        f"{failure_reason}"
                     )
-                except Exception as e:
-                    passed = False
-                    eval_result = {"error": str(e)}
-                    failure_reason = str(e)
-
-                if passed:
-                    step_run.status = "completed"
-                    step_run.output = output
-                    step_run.extracted_context = extracted
-                    step_run.evaluation_result = eval_result
-                    step_run.completed_at = datetime.utcnow()
+                    run.completed_at = datetime.utcnow()
                     db.commit()
+                    return
 
-                    accumulated_context = extracted
-                    break
-
-                step_run.evaluation_result = eval_result
-                failure_reason = eval_result.get("reason") or str(eval_result)
-                retry_count += 1
-
-            if not passed:
-                step_run.status = "failed"
-                step_run.failure_reason = failure_reason
-                step_run.completed_at = datetime.utcnow()
-                db.commit()
-
-                run.status = "failed"
-                run.failure_reason = (
-                    f"Step '{step.name}' failed after {step.retry_limit} retries: "
-                    f"{failure_reason}"
-                )
-                run.completed_at = datetime.utcnow()
-                db.commit()
-                return
+            accumulated_context = "\n\n".join(extracted for _, extracted, _ in results)
 
         run.status = "completed"
         run.completed_at = datetime.utcnow()
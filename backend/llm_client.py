@@ -1,10 +1,14 @@
 """
 Unbound API integration - centralized LLM client.
-implements retries, timeouts, and clean error propagation.
+implements retries, timeouts, response caching, and clean error propagation.
 """
 
 import time
+import json
+import asyncio
+import hashlib
 import httpx
+import orjson
 from typing import Tuple
 from config import settings
 
@@ -15,12 +19,69 @@ MODEL_COSTS = {
     "kimi-k2-instruct-0905": {"input": 0.0003, "output": 0.0012},
 }
 
+# Upper bound on in-flight API requests across steps, judges and summaries.
+MAX_CONCURRENT_CALLS = 32
+
+_CLIENT: httpx.AsyncClient | None = None
+_LIMITER: asyncio.Semaphore | None = None
+
+# Deterministic (temperature 0) completions are cached in-process.
+_CACHE_MAX_ENTRIES = 512
+_CACHE: dict[str, Tuple[str, int, int, float, int]] = {}
+_CACHE_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared client so calls reuse pooled TCP/TLS connections."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, read=30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+            http2=True,
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    global _CLIENT, _LIMITER
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+    _LIMITER = None
+
+
+async def _post(url: str, payload: dict, headers: dict) -> httpx.Response:
+    global _LIMITER
+    if _LIMITER is None:
+        _LIMITER = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+    async with _LIMITER:
+        return await _get_client().post(url, json=payload, headers=headers)
+
 
 def _estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     costs = MODEL_COSTS.get(model, MODEL_COSTS["kimi-k2p5"])
     return (input_tokens / 1000 * costs["input"]) + (output_tokens / 1000 * costs["output"])
 
 
+def _cache_key(model: str, messages: list[dict], temperature: float, max_tokens: int) -> str:
+    raw = json.dumps(
+        {"m": model, "t": temperature, "mt": max_tokens, "msgs": messages},
+        sort_keys=True,
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _extract_fast(raw: bytes) -> Tuple[str, int, int]:
+    """Pull (content, prompt_tokens, completion_tokens) straight from the response body."""
+    data = orjson.loads(raw)
+    choice = data.get("choices", [{}])[0]
+    content = choice.get("message", {}).get("content", "") or ""
+
+    usage = data.get("usage", {})
+    return content, usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+
 async def call_llm(
     messages: list[dict],
     model: str = "kimi-k2p5",
@@ -29,9 +90,43 @@ async def call_llm(
 ) -> Tuple[str, int, int, float, int]:
     """
     Call Unbound API with infra-level hardening.
+    Temperature-0 calls are served from an in-memory cache; concurrent
+    identical calls wait on a per-key lock instead of all hitting the API.
+    Cache hits report zero cost and latency.
     Returns: (content, input_tokens, output_tokens, cost_usd, latency_ms)
     """
 
+    if temperature != 0:
+        return await _call_unbound(messages, model, max_tokens, temperature)
+
+    key = _cache_key(model, messages, temperature, max_tokens)
+    lock = _CACHE_LOCKS.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            cached = _CACHE.get(key)
+            if cached is None:
+                result = await _call_unbound(messages, model, max_tokens, temperature)
+                if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+                    oldest = next(iter(_CACHE))
+                    del _CACHE[oldest]
+                    _CACHE_LOCKS.pop(oldest, None)
+                _CACHE[key] = result
+                return result
+            # Served without an API call: nothing was spent and no time was taken.
+            content, input_tokens, output_tokens, _, _ = cached
+            return content, input_tokens, output_tokens, 0.0, 0
+    finally:
+        # Only cached keys keep a lock; a failed call must not leave one behind.
+        if key not in _CACHE and _CACHE_LOCKS.get(key) is lock:
+            del _CACHE_LOCKS[key]
+
+
+async def _call_unbound(
+    messages: list[dict],
+    model: str,
+    max_tokens: int,
+    temperature: float,
+) -> Tuple[str, int, int, float, int]:
     url = f"{settings.unbound_base_url.rstrip('/')}/chat/completions"
     headers = {
         "Authorization": f"Bearer {settings.unbound_api_key}",
@@ -49,21 +144,12 @@ async def call_llm(
 
     for attempt in range(2):
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0, read=30.0)
-            ) as client:
-                resp = await client.post(url, json=payload, headers=headers)
-                resp.raise_for_status()
+            resp = await _post(url, payload, headers)
+            resp.raise_for_status()
 
             latency_ms = int((time.perf_counter() - start) * 1000)
 
-            data = resp.json()
-            choice = data.get("choices", [{}])[0]
-            content = choice.get("message", {}).get("content", "") or ""
-
-            usage = data.get("usage", {})
-            input_tokens = usage.get("prompt_tokens", 0)
-            output_tokens = usage.get("completion_tokens", 0)
+            content, input_tokens, output_tokens = _extract_fast(resp.content)
             cost = _estimate_cost(model, input_tokens, output_tokens)
 
             return content, input_tokens, output_tokens, cost, latency_ms
@@ -72,7 +158,6 @@ async def call_llm(
             last_error = e
             if attempt == 1:
                 break
-            await httpx.AsyncClient().aclose()
 
         except httpx.HTTPStatusError as e:
             raise RuntimeError(
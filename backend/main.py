@@ -2,15 +2,14 @@
 FastAPI application - Agentic Workflow Builder.
 APIs: Workflow CRUD, Step config, Run workflow, Poll status, Execution logs.
 """
-import uuid
 import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from database import get_db, engine
-from models import Base, Workflow, WorkflowStep, WorkflowRun, StepRun, LLMLog
+from models import Base, Workflow, WorkflowStep, WorkflowRun, StepRun, LLMLog, new_id
 from schemas import (
     WorkflowCreate,
     WorkflowUpdate,
@@ -22,16 +21,25 @@ from schemas import (
     WorkflowRunResponse,
     WorkflowRunDetailResponse,
     StepRunResponse,
-    LLMLogResponse,
+    LLMLogSummaryResponse,
+    LLMLogDetailResponse,
+    dump_list,
+    fast_dump,
+    warm_schemas,
 )
 from executor import run_workflow
+from llm_client import close_client
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
+    # Response schemas are deferred at import; build them (~3 ms) before
+    # serving so the first requests don't pay for it.
+    warm_schemas()
     yield
     # shutdown
+    await close_client()
 
 
 app = FastAPI(title="Agentic Workflow Builder", lifespan=lifespan)
@@ -43,6 +51,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _respond(content: bytes) -> Response:
+    """
+    Wrap pre-encoded JSON. Response models are built from DB rows, so FastAPI's
+    response re-validation is skipped; response_model is kept on the routes for
+    the OpenAPI schema.
+    """
+    return Response(content=content, media_type="application/json")
+
+
 @app.get("/")
 def home():
     return {"message ":"Connection Successful"}
@@ -50,28 +67,34 @@ def home():
 # --- Workflow CRUD ---
 @app.get("/workflows", response_model=list[WorkflowResponse])
 def list_workflows(db: Session = Depends(get_db)):
-    return db.query(Workflow).order_by(Workflow.created_at.desc()).all()
+    rows = db.query(Workflow).order_by(Workflow.created_at.desc()).all()
+    return _respond(dump_list(WorkflowResponse.from_rows(rows)))
 
 
 @app.post("/workflows", response_model=WorkflowResponse)
 def create_workflow(data: WorkflowCreate, db: Session = Depends(get_db)):
     w = Workflow(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         name=data.name,
         description=data.description,
     )
     db.add(w)
     db.commit()
     db.refresh(w)
-    return w
+    return _respond(fast_dump(WorkflowResponse.from_orm_fast(w)))
 
 
 @app.get("/workflows/{workflow_id}", response_model=WorkflowDetailResponse)
 def get_workflow(workflow_id: str, db: Session = Depends(get_db)):
-    w = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+    w = (
+        db.query(Workflow)
+        .options(joinedload(Workflow.steps))
+        .filter(Workflow.id == workflow_id)
+        .first()
+    )
     if not w:
         raise HTTPException(404, "Workflow not found")
-    return w
+    return _respond(fast_dump(WorkflowDetailResponse.from_orm_fast(w)))
 
 
 @app.patch("/workflows/{workflow_id}", response_model=WorkflowResponse)
@@ -79,13 +102,13 @@ def update_workflow(workflow_id: str, data: WorkflowUpdate, db: Session = Depend
     w = db.query(Workflow).filter(Workflow.id == workflow_id).first()
     if not w:
         raise HTTPException(404, "Workflow not found")
-    if data.name is not None:
-        w.name = data.name
-    if data.description is not None:
-        w.description = data.description
-    db.commit()
-    db.refresh(w)
-    return w
+    updates = {k: v for k, v in data.to_update_dict().items() if v is not None}
+    if updates:
+        for k, v in updates.items():
+            setattr(w, k, v)
+        db.commit()
+        db.refresh(w)
+    return _respond(fast_dump(WorkflowResponse.from_orm_fast(w)))
 
 
 @app.delete("/workflows/{workflow_id}")
@@ -105,7 +128,7 @@ def create_step(workflow_id: str, data: StepCreate, db: Session = Depends(get_db
     if not w:
         raise HTTPException(404, "Workflow not found")
     s = WorkflowStep(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         workflow_id=workflow_id,
         position=data.position,
         name=data.name,
@@ -123,7 +146,7 @@ def create_step(workflow_id: str, data: StepCreate, db: Session = Depends(get_db
     db.add(s)
     db.commit()
     db.refresh(s)
-    return s
+    return _respond(fast_dump(StepResponse.from_orm_fast(s)))
 
 
 @app.patch("/workflows/{workflow_id}/steps/{step_id}", response_model=StepResponse)
@@ -137,11 +160,13 @@ def update_step(
     )
     if not s:
         raise HTTPException(404, "Step not found")
-    for k, v in data.model_dump(exclude_unset=True).items():
-        setattr(s, k, v)
-    db.commit()
-    db.refresh(s)
-    return s
+    updates = data.to_update_dict()
+    if updates:
+        for k, v in updates.items():
+            setattr(s, k, v)
+        db.commit()
+        db.refresh(s)
+    return _respond(fast_dump(StepResponse.from_orm_fast(s)))
 
 
 @app.delete("/workflows/{workflow_id}/steps/{step_id}")
@@ -172,7 +197,7 @@ def trigger_run(
         raise HTTPException(400, "Workflow has no steps")
 
     run = WorkflowRun(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         workflow_id=workflow_id,
         status="pending",
     )
@@ -189,40 +214,51 @@ def trigger_run(
             session.close()
 
     background_tasks.add_task(_run)
-    return run
+    return _respond(fast_dump(WorkflowRunResponse.from_orm_fast(run)))
 
 
 # --- Poll workflow status ---
 @app.get("/runs/{run_id}", response_model=WorkflowRunDetailResponse)
 def get_run(run_id: str, db: Session = Depends(get_db)):
-    run = db.query(WorkflowRun).filter(WorkflowRun.id == run_id).first()
+    run = (
+        db.query(WorkflowRun)
+        .options(joinedload(WorkflowRun.step_runs))
+        .filter(WorkflowRun.id == run_id)
+        .first()
+    )
     if not run:
         raise HTTPException(404, "Run not found")
-    return run
+    return _respond(fast_dump(WorkflowRunDetailResponse.from_orm_fast(run)))
 
 
 @app.get("/workflows/{workflow_id}/runs", response_model=list[WorkflowRunResponse])
 def list_runs(workflow_id: str, db: Session = Depends(get_db)):
-    return (
+    rows = (
         db.query(WorkflowRun)
         .filter(WorkflowRun.workflow_id == workflow_id)
         .order_by(WorkflowRun.created_at.desc())
         .all()
     )
+    return _respond(dump_list(WorkflowRunResponse.from_rows(rows)))
 
 
 # --- Execution logs ---
-@app.get("/runs/{run_id}/logs", response_model=list[LLMLogResponse])
+@app.get("/runs/{run_id}/logs", response_model=list[LLMLogSummaryResponse])
 def get_run_logs(run_id: str, db: Session = Depends(get_db)):
     run = db.query(WorkflowRun).filter(WorkflowRun.id == run_id).first()
     if not run:
         raise HTTPException(404, "Run not found")
-    step_run_ids = [sr.id for sr in run.step_runs]
-    logs = db.query(LLMLog).filter(LLMLog.step_run_id.in_(step_run_ids)).order_by(LLMLog.created_at).all()
-    return logs
+    rows = (
+        db.query(*LLMLogSummaryResponse.columns(LLMLog))
+        .join(StepRun, LLMLog.step_run_id == StepRun.id)
+        .filter(StepRun.workflow_run_id == run_id)
+        .order_by(LLMLog.created_at)
+        .all()
+    )
+    return _respond(dump_list(LLMLogSummaryResponse.from_rows(rows)))
 
 
-@app.get("/runs/{run_id}/steps/{step_run_id}/logs", response_model=list[LLMLogResponse])
+@app.get("/runs/{run_id}/steps/{step_run_id}/logs", response_model=list[LLMLogSummaryResponse])
 def get_step_run_logs(run_id: str, step_run_id: str, db: Session = Depends(get_db)):
     step_run = (
         db.query(StepRun)
@@ -231,4 +267,18 @@ def get_step_run_logs(run_id: str, step_run_id: str, db: Session = Depends(get_d
     )
     if not step_run:
         raise HTTPException(404, "Step run not found")
-    return db.query(LLMLog).filter(LLMLog.step_run_id == step_run_id).order_by(LLMLog.created_at).all()
+    rows = (
+        db.query(*LLMLogSummaryResponse.columns(LLMLog))
+        .filter(LLMLog.step_run_id == step_run_id)
+        .order_by(LLMLog.created_at)
+        .all()
+    )
+    return _respond(dump_list(LLMLogSummaryResponse.from_rows(rows)))
+
+
+@app.get("/logs/{log_id}", response_model=LLMLogDetailResponse)
+def get_log(log_id: str, db: Session = Depends(get_db)):
+    log = db.query(LLMLog).filter(LLMLog.id == log_id).first()
+    if not log:
+        raise HTTPException(404, "Log not found")
+    return _respond(fast_dump(LLMLogDetailResponse.from_orm_fast(log)))
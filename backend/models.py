@@ -1,16 +1,22 @@
 """SQLAlchemy models matching the schema."""
+import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, DECIMAL, DateTime, JSON
+from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, DECIMAL, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from database import Base
 
 
+def new_id() -> str:
+    """Primary key for new rows: 32-char hex UUID4 (fits the String(36) columns)."""
+    return uuid.uuid4().hex
+
+
 class Workflow(Base):
     __tablename__ = "workflows"
 
     id = Column(String(36), primary_key=True)
     name = Column(String(255), nullable=False)
-    description = Column(Text)
+    description = Column(Text, default="")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -28,13 +34,13 @@ class WorkflowStep(Base):
     prompt_template = Column(Text, nullable=False)
     model = Column(String(100), default="kimi-k2p5")
     max_tokens = Column(Integer, default=4096)
-    temperature = Column(DECIMAL(3, 2), default=0.7)
+    temperature = Column(DECIMAL(3, 2, asdecimal=False), default=0.7)
     retry_limit = Column(Integer, default=3)
     context_mode = Column(String(50), default="summary")
     rule_type = Column(String(50), nullable=False)
-    rule_value = Column(Text)
+    rule_value = Column(Text, default="")
     llm_judge_enabled = Column(Boolean, default=False)
-    llm_judge_prompt = Column(Text)
+    llm_judge_prompt = Column(Text, default="")
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -48,7 +54,7 @@ class WorkflowRun(Base):
     id = Column(String(36), primary_key=True)
     workflow_id = Column(String(36), ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
     status = Column(String(50), default="pending")
-    failure_reason = Column(Text)
+    failure_reason = Column(Text, default="")
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -70,7 +76,7 @@ class StepRun(Base):
     output = Column(Text)
     extracted_context = Column(Text)
     evaluation_result = Column(JSON)
-    failure_reason = Column(Text)
+    failure_reason = Column(Text, default="")
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -78,6 +84,10 @@ class StepRun(Base):
     workflow_run = relationship("WorkflowRun", back_populates="step_runs")
     llm_logs = relationship("LLMLog", back_populates="step_run")
 
+    __table_args__ = (
+        Index("idx_step_runs_run_position", "workflow_run_id", "position"),
+    )
+
 
 class LLMLog(Base):
     __tablename__ = "llm_logs"
@@ -91,9 +101,13 @@ class LLMLog(Base):
     input_tokens = Column(Integer, default=0)
     output_tokens = Column(Integer, default=0)
     total_tokens = Column(Integer, default=0)
-    cost_usd = Column(DECIMAL(10, 6), default=0)
+    cost_usd = Column(DECIMAL(10, 6, asdecimal=False), default=0)
     model = Column(String(100))
     latency_ms = Column(Integer)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     step_run = relationship("StepRun", back_populates="llm_logs")
+
+    __table_args__ = (
+        Index("idx_llm_logs_step_run_created", "step_run_id", "created_at"),
+    )
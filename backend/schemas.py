@@ -1,53 +1,150 @@
 """Pydantic schemas for API."""
-from datetime import datetime
-from typing import Optional, Any
-from pydantic import BaseModel, Field
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Optional, Any, Callable, ClassVar, Literal
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+
+# Closed value sets, mirroring the ENUM columns in database/schema.sql.
+RunStatus = Literal["pending", "running", "completed", "failed"]
+ContextMode = Literal["full", "code_only", "json_only", "summary"]
+RuleType = Literal["contains", "regex", "json_valid", "code_block_present"]
+CallType = Literal["main", "retry", "llm_judge"]
+
+# Primary/foreign keys: 32-char hex strings from models.new_id(). Kept as str
+# (uuid.UUID would re-render them with dashes and break lookups); response
+# values come straight from the DB, so validation is skipped.
+Id = SkipValidation[str]
+
+# Timestamps go out as integer milliseconds since the Unix epoch (UTC).
+EpochMs = int
+_TIMESTAMP_FIELDS = frozenset({"created_at", "updated_at", "started_at", "completed_at"})
+_EPOCH = datetime(1970, 1, 1)
+_MS = timedelta(milliseconds=1)
+
+
+def _epoch_ms(dt: Optional[datetime]) -> Optional[EpochMs]:
+    """DateTime columns hold naive UTC (datetime.utcnow), so no tz conversion is needed."""
+    return None if dt is None else (dt - _EPOCH) // _MS
+
+
+class _Schema(BaseModel):
+    """Output-side schema whose core schema is built on first use, not at import.
+
+    Request bodies stay on plain BaseModel: FastAPI builds them at route
+    registration anyway, and deferring them only moves that work into the
+    first request.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    # Schemas nested in this one's fields. They are built first so pydantic-core
+    # embeds their finished validator/serializer by reference instead of
+    # compiling a private copy of each into this model.
+    _children: ClassVar[tuple[type["_Schema"], ...]] = ()
+
+    @classmethod
+    def model_rebuild(cls, **kwargs):
+        for child in cls._children:
+            child.model_rebuild()
+        return super().model_rebuild(**kwargs)
+
+
+class _FastResponse(_Schema):
+    """Response model that can be built from a trusted ORM row without validation."""
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
+
+    # Field name -> response class for nested ORM collections.
+    _nested: ClassVar[dict[str, type["_FastResponse"]]] = {}
+    # Filled in per subclass: field names, one attrgetter fetching all of them
+    # as a tuple, the DateTime fields converted to EpochMs, and the nullable
+    # text columns served as `str = ""` (NULL becomes "").
+    _fields: ClassVar[tuple[str, ...]] = ()
+    _getter: ClassVar[Callable[[Any], tuple]]
+    _timestamps: ClassVar[tuple[str, ...]] = ()
+    _blank_if_null: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._fields = tuple(cls.model_fields)
+        cls._getter = attrgetter(*cls._fields)
+        cls._timestamps = tuple(name for name in cls._fields if name in _TIMESTAMP_FIELDS)
+        cls._blank_if_null = tuple(
+            name for name, field in cls.model_fields.items() if field.annotation is str and field.default == ""
+        )
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        data = dict(zip(cls._fields, cls._getter(obj)))
+        for name in cls._timestamps:
+            data[name] = _epoch_ms(data[name])
+        for name in cls._blank_if_null:
+            if data[name] is None:
+                data[name] = ""
+        for name, child in cls._nested.items():
+            data[name] = child.from_rows(data[name])
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_rows(cls, rows) -> list:
+        return [cls.from_orm_fast(row) for row in rows]
+
+    @classmethod
+    def columns(cls, entity) -> tuple:
+        """Mapped columns of `entity` backing this response, for column-only SELECTs."""
+        return tuple(getattr(entity, name) for name in cls._fields)
+
+
+class _UpdateRequest(BaseModel):
+    """PATCH body: only the fields the client actually sent are applied."""
+
+    def to_update_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.model_fields_set}
 
 
 # Workflow
-class WorkflowBase(BaseModel):
+class WorkflowCreate(BaseModel):
     name: str
     description: Optional[str] = None
 
 
-class WorkflowCreate(WorkflowBase):
-    pass
-
-
-class WorkflowUpdate(BaseModel):
+class WorkflowUpdate(_UpdateRequest):
     name: Optional[str] = None
     description: Optional[str] = None
 
 
-class WorkflowResponse(WorkflowBase):
-    id: str
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
+class WorkflowResponse(_FastResponse):
+    name: str
+    description: str = ""
+    id: Id
+    created_at: EpochMs
+    updated_at: EpochMs
 
 
 # Step
-class StepBase(BaseModel):
+class StepCreate(BaseModel):
     name: str
     prompt_template: str
     model: str = "kimi-k2p5"
     max_tokens: int = 4096
     temperature: float = 0.7
     retry_limit: int = 3
-    context_mode: str = "summary"
-    rule_type: str
+    context_mode: ContextMode = "summary"
+    rule_type: RuleType
     rule_value: Optional[str] = None
     llm_judge_enabled: bool = False
     llm_judge_prompt: Optional[str] = None
-
-
-class StepCreate(StepBase):
     position: int
 
 
-class StepUpdate(BaseModel):
+class StepUpdate(_UpdateRequest):
     name: Optional[str] = None
     position: Optional[int] = None
     prompt_template: Optional[str] = None
@@ -55,82 +152,165 @@ class StepUpdate(BaseModel):
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
     retry_limit: Optional[int] = None
-    context_mode: Optional[str] = None
-    rule_type: Optional[str] = None
+    context_mode: Optional[ContextMode] = None
+    rule_type: Optional[RuleType] = None
     rule_value: Optional[str] = None
     llm_judge_enabled: Optional[bool] = None
     llm_judge_prompt: Optional[str] = None
 
 
-class StepResponse(StepBase):
-    id: str
-    workflow_id: str
+class StepResponse(_FastResponse):
+    name: str
+    prompt_template: str
+    model: str = "kimi-k2p5"
+    max_tokens: int = 4096
+    temperature: float = 0.7
+    retry_limit: int = 3
+    context_mode: ContextMode = "summary"
+    rule_type: RuleType
+    rule_value: str = ""
+    llm_judge_enabled: bool = False
+    llm_judge_prompt: str = ""
+    id: Id
+    workflow_id: Id
     position: int
-    created_at: datetime
-    updated_at: datetime
-
-    class Config:
-        from_attributes = True
+    created_at: EpochMs
+    updated_at: EpochMs
 
 
 # Workflow Run
-class WorkflowRunResponse(BaseModel):
-    id: str
-    workflow_id: str
-    status: str
-    failure_reason: Optional[str] = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
+class WorkflowRunResponse(_FastResponse):
+    id: Id
+    workflow_id: Id
+    status: RunStatus
+    failure_reason: str = ""
+    started_at: Optional[EpochMs] = None
+    completed_at: Optional[EpochMs] = None
+    created_at: EpochMs
 
 
 # Step Run
-class StepRunResponse(BaseModel):
-    id: str
-    workflow_run_id: str
-    workflow_step_id: str
+class EvaluationDetails(_Schema):
+    rule_passed: Optional[bool] = None
+    rule_reason: Optional[str] = None
+    llm_judge_passed: Optional[bool] = None
+    llm_judge_reason: Optional[str] = None
+
+
+class EvaluationResult(_Schema):
+    """Shape written by evaluation.evaluate_completion / the executor's error path."""
+
+    passed: Optional[bool] = None
+    reason: Optional[str] = None
+    details: Optional[EvaluationDetails] = None
+    error: Optional[str] = None
+
+    _children = (EvaluationDetails,)
+
+    @classmethod
+    def from_raw(cls, raw: Optional[dict]) -> Optional["EvaluationResult"]:
+        if raw is None:
+            return None
+        details = raw.get("details")
+        return cls.model_construct(
+            **{
+                **raw,
+                "details": EvaluationDetails.model_construct(**details) if details is not None else None,
+            }
+        )
+
+
+class StepRunResponse(_FastResponse):
+    id: Id
+    workflow_run_id: Id
+    workflow_step_id: Id
     position: int
-    status: str
+    status: RunStatus
     attempt_number: int
     output: Optional[str] = None
     extracted_context: Optional[str] = None
-    evaluation_result: Optional[dict] = None
-    failure_reason: Optional[str] = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    evaluation_result: Optional[EvaluationResult] = None
+    failure_reason: str = ""
+    started_at: Optional[EpochMs] = None
+    completed_at: Optional[EpochMs] = None
 
-    class Config:
-        from_attributes = True
+    _children = (EvaluationResult,)
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        resp = super().from_orm_fast(obj)
+        resp.evaluation_result = EvaluationResult.from_raw(resp.evaluation_result)
+        return resp
 
 
 # LLM Log
-class LLMLogResponse(BaseModel):
-    id: str
-    step_run_id: str
-    call_type: str
+class LLMLogSummaryResponse(_FastResponse):
+    """List view: the prompt/response text is only served by LLMLogDetailResponse."""
+
+    id: Id
+    step_run_id: Id
+    call_type: CallType
     attempt_number: int
-    prompt: str
-    response: str
     input_tokens: int
     output_tokens: int
     total_tokens: int
     cost_usd: float
     model: Optional[str] = None
     latency_ms: Optional[int] = None
-    created_at: datetime
+    created_at: EpochMs
 
-    class Config:
-        from_attributes = True
+
+class LLMLogDetailResponse(LLMLogSummaryResponse):
+    prompt: str
+    response: str
 
 
 # Workflow with steps
 class WorkflowDetailResponse(WorkflowResponse):
-    steps: list[StepResponse] = []
+    steps: SkipValidation[list[StepResponse]] = []
+
+    _nested = {"steps": StepResponse}
+    _children = (StepResponse,)
 
 
 # Run with step runs
 class WorkflowRunDetailResponse(WorkflowRunResponse):
-    step_runs: list[StepRunResponse] = []
+    step_runs: SkipValidation[list[StepRunResponse]] = []
+
+    _nested = {"step_runs": StepRunResponse}
+    _children = (StepRunResponse,)
+
+
+def warm_schemas() -> None:
+    """Build the deferred response schemas now (at startup) instead of on first use."""
+    for cls in (
+        WorkflowResponse,
+        WorkflowDetailResponse,
+        StepResponse,
+        WorkflowRunResponse,
+        WorkflowRunDetailResponse,
+        LLMLogSummaryResponse,
+        LLMLogDetailResponse,
+    ):
+        cls.model_rebuild()
+
+
+# Encoding helpers
+# Response models are filled by model_construct() from DB rows, so each
+# instance's __dict__ is exactly its field values (timestamps already ints):
+# orjson can encode that directly with no pydantic involvement.
+def _orjson_default(obj):
+    # Nested models: steps / step_runs items and evaluation_result.
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def fast_dump(obj: BaseModel) -> bytes:
+    """Encode one response model, bypassing model_dump_json()."""
+    return orjson.dumps(obj.__dict__, default=_orjson_default)
+
+
+def dump_list(items: list) -> bytes:
+    """Encode a list of response models in one pass."""
+    return orjson.dumps([item.__dict__ for item in items], default=_orjson_default)
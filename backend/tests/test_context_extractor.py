@@ -0,0 +1,18 @@
+from context_extractor import extract_json
+
+
+def test_object_wins_over_earlier_footnote():
+    text = 'As noted in [1], the result is: ```json {"status": "ok"}```'
+    assert extract_json(text) == '{"status": "ok"}'
+
+
+def test_object_wins_over_earlier_index():
+    assert extract_json('Use arr[0] then {"a": 1}') == '{"a": 1}'
+
+
+def test_array_when_no_object():
+    assert extract_json("Use {braces} like [1, 2]") == "[1, 2]"
+
+
+def test_no_json():
+    assert extract_json("no json here") == ""
@@ -0,0 +1,33 @@
+import re
+
+import pytest
+
+from evaluation import _rule_regex
+
+
+def _reference(text: str, pattern: str) -> bool:
+    try:
+        return bool(re.search(pattern, text, re.DOTALL))
+    except re.error:
+        return False
+
+
+@pytest.mark.parametrize(
+    "text, pattern",
+    [
+        ("line one\nline two", ".*"),
+        ("line one\nline two", ".+"),
+        ("the answer is 42", "answer"),
+        ("the answer is 42", "missing"),
+        ("the answer is 42", "^"),
+        ("abc at the start", "^abc"),
+        ("not abc at the start", "^abc"),
+        ("the answer is 42", r"\d"),
+        ("no digits here", r"\d"),
+        ("[bracket]", "["),
+        ("Answer", "answer"),
+        ("Answer", "^answer"),
+    ],
+)
+def test_rule_regex_matches_re_search(text, pattern):
+    assert _rule_regex(text, pattern) == _reference(text, pattern)
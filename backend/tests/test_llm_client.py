@@ -0,0 +1,26 @@
+import asyncio
+
+import llm_client
+
+
+def test_cache_hit_reports_no_cost_or_latency(monkeypatch):
+    calls = []
+
+    async def fake_call_unbound(messages, model, max_tokens, temperature):
+        calls.append(messages)
+        return "answer", 10, 5, 0.123, 1500
+
+    monkeypatch.setattr(llm_client, "_call_unbound", fake_call_unbound)
+    monkeypatch.setattr(llm_client, "_CACHE", {})
+    monkeypatch.setattr(llm_client, "_CACHE_LOCKS", {})
+    messages = [{"role": "user", "content": "same prompt"}]
+
+    async def run():
+        first = await llm_client.call_llm(messages, temperature=0.0)
+        second = await llm_client.call_llm(messages, temperature=0.0)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert first == ("answer", 10, 5, 0.123, 1500)
+    assert second == ("answer", 10, 5, 0.0, 0)
@@ -14,7 +14,11 @@ CREATE TABLE workflows (
     INDEX idx_workflows_created (created_at)
 );
 
--- Steps within a workflow (ordered by position)
+-- Steps within a workflow (ordered by position; steps sharing a position run in parallel)
+-- Databases created before sibling steps existed still carry the unique key; migrate with:
+--   ALTER TABLE workflow_steps
+--     ADD INDEX idx_steps_workflow_position (workflow_id, position),
+--     DROP INDEX uk_workflow_position;
 CREATE TABLE workflow_steps (
     id VARCHAR(36) PRIMARY KEY,
     workflow_id VARCHAR(36) NOT NULL,
@@ -35,7 +39,7 @@ CREATE TABLE workflow_steps (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (workflow_id) REFERENCES workflows(id) ON DELETE CASCADE,
-    UNIQUE KEY uk_workflow_position (workflow_id, position),
+    INDEX idx_steps_workflow_position (workflow_id, position),
     INDEX idx_steps_workflow (workflow_id)
 );
 
@@ -72,7 +76,7 @@ CREATE TABLE step_runs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (workflow_run_id) REFERENCES workflow_runs(id) ON DELETE CASCADE,
     FOREIGN KEY (workflow_step_id) REFERENCES workflow_steps(id) ON DELETE CASCADE,
-    INDEX idx_step_runs_run (workflow_run_id),
+    INDEX idx_step_runs_run_position (workflow_run_id, position),
     INDEX idx_step_runs_step (workflow_step_id)
 );
 
@@ -92,6 +96,6 @@ CREATE TABLE llm_logs (
     latency_ms INT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (step_run_id) REFERENCES step_runs(id) ON DELETE CASCADE,
-    INDEX idx_llm_logs_step_run (step_run_id),
+    INDEX idx_llm_logs_step_run_created (step_run_id, created_at),
     INDEX idx_llm_logs_created (created_at)
 );
@@ -45,4 +45,7 @@ export const api = {
     get: (id) => req('GET', `/runs/${id}`),
     logs: (id) => req('GET', `/runs/${id}/logs`),
   },
+  logs: {
+    get: (id) => req('GET', `/logs/${id}`),
+  },
 };
@@ -1,9 +1,39 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import { api } from '../api';
 
 const POLL_INTERVAL = 2000;
 
+// Log listings omit prompt/response; fetch them the first time the row is expanded.
+function LogText({ logId }) {
+  const [detail, setDetail] = useState(null);
+  const [error, setError] = useState(null);
+  const inFlight = useRef(false);
+
+  const onToggle = (e) => {
+    if (!e.currentTarget.open || detail || inFlight.current) return;
+    inFlight.current = true;
+    setError(null);
+    api.logs.get(logId)
+      .then(setDetail)
+      .catch((err) => setError(err.message))
+      .finally(() => { inFlight.current = false; });
+  };
+
+  return (
+    <details onToggle={onToggle}>
+      <summary>Prompt / Response</summary>
+      <pre style={{ background: '#0d1117', padding: '0.5rem', borderRadius: 4, overflow: 'auto', maxHeight: 150, fontSize: '0.75rem' }}>
+        {error
+          ? `Error: ${error}`
+          : detail
+            ? `${detail.prompt?.slice(0, 500)}... / ${detail.response?.slice(0, 500)}...`
+            : 'Loading...'}
+      </pre>
+    </details>
+  );
+}
+
 export default function RunStatus() {
   const { runId } = useParams();
   const [run, setRun] = useState(null);
@@ -99,12 +129,7 @@ export default function RunStatus() {
               <span>Tokens: {log.total_tokens} | Cost: ${log.cost_usd?.toFixed(6)}</span>
               {log.latency_ms && <span>Latency: {log.latency_ms}ms</span>}
             </div>
-            <details>
-              <summary>Prompt / Response</summary>
-              <pre style={{ background: '#0d1117', padding: '0.5rem', borderRadius: 4, overflow: 'auto', maxHeight: 150, fontSize: '0.75rem' }}>
-                {log.prompt?.slice(0, 500)}... / {log.response?.slice(0, 500)}...
-              </pre>
-            </details>
+            <LogText logId={log.id} />
           </div>
         ))
       )}
@@ -54,7 +54,9 @@ export default function WorkflowEditor() {
 
   const addStep = async () => {
     if (!workflowId) return;
-    const pos = (workflow.steps?.length || 0) + 1;
+    // Next free position: after deletes, steps.length + 1 can collide with an
+    // existing step, and steps sharing a position run in parallel.
+    const pos = Math.max(0, ...(workflow.steps || []).map((s) => s.position)) + 1;
     const step = {
       position: pos,
       name: `Step ${pos}`,